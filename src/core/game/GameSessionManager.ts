@@ -118,10 +118,17 @@ export class GameSessionManager {
         try {
             const sessions: GameSession[] = await db.sessions.getByHost(hostId);
             const draftSessions: GameSession[] = sessions.filter(s => (s as any).status === 'draft');
-            if (draftSessions.length > 0) {
-                return draftSessions.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())[0] as GameSession;
+            // Single pass for the newest draft; no need to sort the whole list
+            let latestDraft: GameSession | null = null;
+            let latestTime = -Infinity;
+            for (const session of draftSessions) {
+                const createdTime = new Date(session.created_at).getTime();
+                if (latestDraft === null || createdTime > latestTime) {
+                    latestTime = createdTime;
+                    latestDraft = session;
+                }
             }
-            return null;
+            return latestDraft;
         } catch (error) {
             console.error(`[GameSessionManager] Error getting latest draft:`, error);
             throw new Error(`Failed to get latest draft: ${formatSupabaseError(error)}`);
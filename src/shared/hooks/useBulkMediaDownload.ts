@@ -1,4 +1,4 @@
-import {useState, useCallback } from 'react';
+import {useState, useCallback, useEffect, useRef} from 'react';
 import {BulkDownloadProgress, mediaManager} from '@shared/services/MediaManager';
 import {GameVersion} from '@shared/types/game';
 import {UserType} from '@shared/constants/formOptions';
@@ -12,12 +12,71 @@ interface UseBulkMediaDownloadReturn {
     error: string | null;
 }
 
-export const useBulkMediaDownload = (): UseBulkMediaDownloadReturn => {
+/**
+ * Preloads all media for a game version into the local cache.
+ * @param concurrency Parallel downloads; defaults to MediaManager's bulk download setting
+ */
+export const useBulkMediaDownload = (concurrency?: number): UseBulkMediaDownloadReturn => {
     const [isDownloading, setIsDownloading] = useState<boolean>(false);
     const [progress, setProgress] = useState<BulkDownloadProgress | null>(null);
     const [error, setError] = useState<string | null>(null);
     const [cacheCleared, setCacheCleared] = useState<number>(0); // ADD THIS - forces re-render
 
+    // MediaManager reports progress twice per file; coalesce those into at most
+    // one state update per animation frame so large preloads don't re-render
+    // the progress UI hundreds of times a second
+    const pendingProgressRef = useRef<BulkDownloadProgress | null>(null);
+    const progressFrameRef = useRef<number | null>(null);
+    // The download outlives this hook in the MediaManager singleton; ignore its reports once unmounted
+    const isMountedRef = useRef<boolean>(true);
+
+    // MediaManager mutates a single progress object, so keep a reference and only
+    // snapshot it when it is actually handed to React
+    const flushProgress = useCallback((): void => {
+        const latest = pendingProgressRef.current;
+        setProgress(latest ? {...latest} : null);
+    }, []);
+
+    // Drops a queued update so it cannot restore a stale snapshot after a reset
+    const discardPendingProgress = useCallback((): void => {
+        if (progressFrameRef.current !== null) {
+            cancelAnimationFrame(progressFrameRef.current);
+            progressFrameRef.current = null;
+        }
+        pendingProgressRef.current = null;
+    }, []);
+
+    const reportProgress = useCallback((progressData: BulkDownloadProgress): void => {
+        if (!isMountedRef.current) return;
+
+        pendingProgressRef.current = progressData;
+
+        // Completion and cancellation are the last reports of a run; show them at once
+        if (progressData.isComplete || progressData.currentFile === 'cancelled') {
+            if (progressFrameRef.current !== null) {
+                cancelAnimationFrame(progressFrameRef.current);
+                progressFrameRef.current = null;
+            }
+            flushProgress();
+            return;
+        }
+
+        if (progressFrameRef.current === null) {
+            progressFrameRef.current = requestAnimationFrame(() => {
+                progressFrameRef.current = null;
+                flushProgress();
+            });
+        }
+    }, [flushProgress]);
+
+    useEffect(() => {
+        isMountedRef.current = true;
+        return () => {
+            isMountedRef.current = false;
+            discardPendingProgress();
+        };
+    }, [discardPendingProgress]);
+
     const startDownload = useCallback(async (
         gameVersion: GameVersion,
         userType: UserType
@@ -26,14 +85,15 @@ export const useBulkMediaDownload = (): UseBulkMediaDownloadReturn => {
         if (mediaManager.isBulkDownloadInProgress()) return;
         setIsDownloading(true);
         setError(null);
+        discardPendingProgress();
         setProgress(null);
 
         try {
             await mediaManager.ensureAllMediaIsCached(
                 gameVersion,
                 userType,
-                (progressData: BulkDownloadProgress) => { setProgress({ ...progressData }); },
-                3);
+                reportProgress,
+                concurrency);
         } catch (err) {
             const errorMessage = err instanceof Error ? err.message : 'Unknown error during bulk download';
             setError(errorMessage);
@@ -41,16 +101,17 @@ export const useBulkMediaDownload = (): UseBulkMediaDownloadReturn => {
         } finally {
             setIsDownloading(false);
         }
-    }, []);
+    }, [concurrency, reportProgress, discardPendingProgress]);
 
     const cancelDownload = useCallback((): void => mediaManager.cancelBulkDownload(), []);
 
     const clearCache = useCallback((): void => {
         mediaManager.clearBulkDownloadCache();
+        discardPendingProgress();
         setProgress(null);
         setError(null);
         setCacheCleared(prev => prev + 1); // INCREMENT to force re-render
-    }, []);
+    }, [discardPendingProgress]);
 
     return {
         isDownloading,
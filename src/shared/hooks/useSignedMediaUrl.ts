@@ -33,6 +33,14 @@ export const useSignedMediaUrl = (sourcePath: string | undefined, gameVersion?:
             return;
         }
 
+        // Precached slides are already in memory - show them straight away
+        // instead of flashing a loading state for an async lookup
+        const cachedUrl = mediaManager.getCachedMediaUrl(sourcePath, userType, gameVersion);
+        if (cachedUrl) {
+            setState({url: cachedUrl, isLoading: false, error: null});
+            return;
+        }
+
         let isMounted = true;
 
         const fetchUrl = async () => {
@@ -204,21 +204,23 @@ class IndexedDBCache {
             const transaction = this.db!.transaction([this.STORE_NAME], 'readwrite');
             const store = transaction.objectStore(this.STORE_NAME);
             const index = store.index('expiresAt');
-            const now = Date.now();
+            let removedCount = 0;
 
-            const request = index.openCursor();
+            // Walk only the expired range of the index, and only its keys, so
+            // live entries (and their blob data) are never read
+            const request = index.openKeyCursor(IDBKeyRange.upperBound(Date.now()));
 
             request.onsuccess = (event) => {
-                const cursor = (event.target as IDBRequest<IDBCursorWithValue>).result;
+                const cursor = (event.target as IDBRequest<IDBCursor | null>).result;
 
                 if (cursor) {
-                    const entry = cursor.value as CachedBlobEntry;
-                    if (entry.expiresAt <= now) {
-                        cursor.delete();
-                        console.log(`[IndexedDBCache] Cleaned up expired entry: ${entry.fileName}`);
-                    }
+                    store.delete(cursor.primaryKey);
+                    removedCount++;
                     cursor.continue();
                 } else {
+                    if (removedCount > 0) {
+                        console.log(`[IndexedDBCache] Cleaned up ${removedCount} expired entries`);
+                    }
                     resolve();
                 }
             };
@@ -15,6 +15,11 @@ interface CachedBlobUrl {
     expiresAt: number;
 }
 
+interface CachedSignedUrl {
+    signedUrl: string;
+    expiresAt: number;
+}
+
 export interface BulkDownloadProgress {
     downloaded: number;
     total: number;
@@ -32,11 +37,36 @@ class MediaManager {
     
     // Single in-memory cache for speed (read-through cache on top of IndexedDB)
     private blobCache = new Map<string, CachedBlobUrl>();
+
+    // Storage bucket handle, created on first use (see getBucket)
+    private bucket: ReturnType<typeof supabase.storage.from> | null = null;
+
+    // Signed URLs minted ahead of time in batches (see prefetchSignedUrls)
+    private signedUrlCache = new Map<string, CachedSignedUrl>();
     
     private readonly BUCKET_NAME = 'slide-content';
+    private readonly SIGNED_URL_EXPIRY_SECONDS = 3600; // 1 hour signed URL validity
+    private readonly SIGNED_URL_REFRESH_MARGIN_MS = 60 * 1000;
+    private readonly SIGNED_URL_BATCH_SIZE = 100;
+    private readonly MAX_FETCH_RETRIES = 2;
+    private readonly FETCH_RETRY_BASE_DELAY_MS = 1000;
+    private readonly TRANSIENT_HTTP_STATUSES: ReadonlySet<number> = new Set([408, 429, 500, 502, 503, 504]);
     private readonly CACHE_EXPIRY_HOURS = 24; // 24 hours for IndexedDB cache
     private readonly CACHE_EXPIRY_MS = this.CACHE_EXPIRY_HOURS * 60 * 60 * 1000;
     private readonly DEFAULT_PRECACHE_COUNT = 3;
+    // Parallel downloads during bulk preload. Kept below the browser's six
+    // connections per host so that, over HTTP/1.1, signed URL requests, database
+    // calls and the on-screen slide still get a connection while videos download.
+    private readonly DEFAULT_BULK_DOWNLOAD_CONCURRENCY = 4;
+
+    // Lookups past the in-memory cache that are still running, keyed by file
+    private inFlightLoads = new Map<string, Promise<string>>();
+
+    // Bumped by clearCache; loads started before a clear must not write back
+    private cacheGeneration = 0;
+
+    // IndexedDB writes still in flight (see fetchAndCacheMedia)
+    private pendingCacheWrites = new Set<Promise<void>>();
 
     // Track precaching operations to avoid duplicates
     private precachingInProgress = new Set<string>();
@@ -72,6 +102,41 @@ class MediaManager {
             return memCached.blobUrl;
         }
 
+        // Join a lookup that is already running for this file (e.g. the precacher
+        // and the slide renderer asking at the same moment) instead of starting
+        // a second IndexedDB read and download
+        for (;;) {
+            const inFlight = this.inFlightLoads.get(fileName);
+            if (!inFlight) {
+                break;
+            }
+            try {
+                return await this.raceWithSignal(inFlight, signal);
+            } catch (error) {
+                // Our own cancellation, or a real failure, ends here
+                if (signal?.aborted || !(error instanceof DOMException && error.name === 'AbortError')) {
+                    throw error;
+                }
+                // Only the caller that owned the shared load cancelled it. Its entry is
+                // already gone, so the first joiner back starts a new load and the rest join it
+            }
+        }
+
+        const load: Promise<string> = this.loadMedia(fileName, signal).finally(() => {
+            if (this.inFlightLoads.get(fileName) === load) {
+                this.inFlightLoads.delete(fileName);
+            }
+        });
+        this.inFlightLoads.set(fileName, load);
+        return await load;
+    }
+
+    /**
+     * Loads media missing from the in-memory cache: IndexedDB first, then Supabase
+     */
+    private async loadMedia(fileName: string, signal?: AbortSignal): Promise<string> {
+        const generation = this.cacheGeneration;
+
         // STEP 2: Check IndexedDB (persistent, cross-tab)
         try {
             const idbEntry = await indexedDBCache.get(fileName);
@@ -79,10 +144,12 @@ class MediaManager {
                 console.log(`[MediaManager] Using IndexedDB cache for ${fileName}`);
                 
                 // Warm up in-memory cache for future access
-                this.blobCache.set(fileName, {
-                    blobUrl: idbEntry.blobUrl,
-                    expiresAt: idbEntry.expiresAt
-                });
+                if (generation === this.cacheGeneration) {
+                    this.blobCache.set(fileName, {
+                        blobUrl: idbEntry.blobUrl,
+                        expiresAt: idbEntry.expiresAt
+                    });
+                }
                 
                 return idbEntry.blobUrl;
             }
@@ -91,19 +158,161 @@ class MediaManager {
         }
 
         // STEP 3: Fetch from Supabase and cache in both layers
-        return await this.fetchAndCacheMedia(fileName, signal);
+        return await this.fetchAndCacheMedia(fileName, generation, signal);
     }
 
     /**
      * Fetches media from Supabase and stores in both cache layers
      */
-    private async fetchAndCacheMedia(fileName: string, signal?: AbortSignal): Promise<string> {
+    private async fetchAndCacheMedia(fileName: string, generation: number, signal?: AbortSignal): Promise<string> {
         console.log(`[MediaManager] Fetching ${fileName} from Supabase`);
 
-        // Get signed URL from Supabase
-        const {data, error} = await supabase.storage
-            .from(this.BUCKET_NAME)
-            .createSignedUrl(fileName, 3600); // 1 hour signed URL validity
+        const signedUrl = await this.getSignedUrl(fileName);
+
+        // Fetch the actual file as a blob
+        const blob = await this.fetchBlobWithRetry(signedUrl, fileName, signal);
+        const blobUrl = URL.createObjectURL(blob);
+        const expiresAt = Date.now() + this.CACHE_EXPIRY_MS;
+
+        // The cache was cleared while this was downloading; hand the file to the
+        // caller but do not bring the old content back into either cache
+        if (generation !== this.cacheGeneration) {
+            return blobUrl;
+        }
+
+        // Store in both caches
+        const cacheEntry = {blobUrl, expiresAt};
+        this.blobCache.set(fileName, cacheEntry);
+
+        // Persist to IndexedDB in the background so the caller (and the next
+        // bulk download) is not held up by the write
+        const pendingWrite = indexedDBCache.set(fileName, blobUrl, blob, expiresAt)
+            .then(() => {
+                console.log(`[MediaManager] Cached ${fileName} in memory + IndexedDB`);
+            })
+            .catch(idbError => {
+                console.warn(`[MediaManager] Failed to store in IndexedDB for ${fileName}:`, idbError);
+                // Continue anyway - in-memory cache still works
+            })
+            .finally(() => {
+                this.pendingCacheWrites.delete(pendingWrite);
+            });
+        this.pendingCacheWrites.add(pendingWrite);
+
+        return blobUrl;
+    }
+
+    /**
+     * Returns the storage bucket handle. supabase.storage builds a new storage
+     * client on every access, so the handle is created once and reused.
+     */
+    private getBucket(): ReturnType<typeof supabase.storage.from> {
+        if (!this.bucket) {
+            this.bucket = supabase.storage.from(this.BUCKET_NAME);
+        }
+        return this.bucket;
+    }
+
+    /**
+     * Downloads a file as a Blob with exponential backoff for transient failures:
+     * network errors (including a connection dropped mid-body) and 408/429/5xx
+     * responses. Other HTTP errors fail at once and aborts are never retried.
+     */
+    private async fetchBlobWithRetry(url: string, fileName: string, signal?: AbortSignal): Promise<Blob> {
+        for (let attempt = 0; ; attempt++) {
+            const canRetry = attempt < this.MAX_FETCH_RETRIES;
+            try {
+                const response = await fetch(url, { signal });
+                if (response.ok) {
+                    // The body is read inside the retried unit: a dropped connection surfaces here
+                    return await response.blob();
+                }
+                if (!this.TRANSIENT_HTTP_STATUSES.has(response.status) || !canRetry) {
+                    throw new Error(
+                        `Failed to fetch ${fileName}: ${response.status} ${response.statusText}`
+                    );
+                }
+                // Discard the error body so its connection is released before backing off
+                response.body?.cancel().catch(() => {});
+                console.warn(`[MediaManager] ${fileName} returned ${response.status}, retrying`);
+            } catch (error) {
+                // fetch() and blob() report network failures as TypeError; anything else (including aborts) is final
+                if (!(error instanceof TypeError) || !canRetry) {
+                    throw error;
+                }
+                console.warn(`[MediaManager] Network error fetching ${fileName}, retrying:`, error.message);
+            }
+
+            // Exponential backoff with jitter
+            const delay = this.FETCH_RETRY_BASE_DELAY_MS * Math.pow(2, attempt) + Math.random() * 1000;
+            await this.waitForRetry(delay, signal);
+        }
+    }
+
+    /**
+     * Sleeps for the backoff delay, rejecting with an AbortError as soon as
+     * `signal` fires so a cancelled download does not sit out the wait
+     */
+    private waitForRetry(delayMs: number, signal?: AbortSignal): Promise<void> {
+        return new Promise((resolve, reject) => {
+            if (signal?.aborted) {
+                reject(this.createAbortError());
+                return;
+            }
+
+            const onAbort = () => {
+                clearTimeout(timer);
+                reject(this.createAbortError());
+            };
+            const timer = setTimeout(() => {
+                signal?.removeEventListener('abort', onAbort);
+                resolve();
+            }, delayMs);
+            signal?.addEventListener('abort', onAbort, {once: true});
+        });
+    }
+
+    /**
+     * Waits for a shared promise, rejecting with an AbortError as soon as this
+     * caller's `signal` fires (the shared work itself keeps running)
+     */
+    private raceWithSignal<T>(promise: Promise<T>, signal?: AbortSignal): Promise<T> {
+        if (!signal) {
+            return promise;
+        }
+
+        return new Promise<T>((resolve, reject) => {
+            if (signal.aborted) {
+                reject(this.createAbortError());
+                return;
+            }
+
+            const onAbort = () => reject(this.createAbortError());
+            signal.addEventListener('abort', onAbort, {once: true});
+            promise
+                .then(resolve, reject)
+                .finally(() => signal.removeEventListener('abort', onAbort));
+        });
+    }
+
+    private createAbortError(): DOMException {
+        return new DOMException('The operation was aborted.', 'AbortError');
+    }
+
+    /**
+     * Returns a signed URL for a file, reusing one minted by prefetchSignedUrls
+     * when it is still valid
+     */
+    private async getSignedUrl(fileName: string): Promise<string> {
+        const cached = this.signedUrlCache.get(fileName);
+        if (cached) {
+            this.signedUrlCache.delete(fileName);
+            if (cached.expiresAt > Date.now()) {
+                return cached.signedUrl;
+            }
+        }
+
+        const {data, error} = await this.getBucket().createSignedUrl(fileName, this.SIGNED_URL_EXPIRY_SECONDS);
 
         if (error) {
             console.error(`[MediaManager] Error creating signed URL for ${fileName}:`, error);
@@ -120,31 +329,44 @@ class MediaManager {
             throw new Error(`No signed URL returned for ${fileName}`);
         }
 
-        // Fetch the actual file as a blob
-        const response = await fetch(data.signedUrl, { signal });
-        if (!response.ok) {
-            throw new Error(
-                `Failed to fetch ${fileName}: ${response.status} ${response.statusText}`
-            );
-        }
+        return data.signedUrl;
+    }
 
-        const blob = await response.blob();
-        const blobUrl = URL.createObjectURL(blob);
-        const expiresAt = Date.now() + this.CACHE_EXPIRY_MS;
+    /**
+     * Mints signed URLs for many files with one storage request per batch
+     * instead of one per file. Failures are non-fatal: any path left without
+     * a cached URL falls back to createSignedUrl when it is fetched.
+     * Stops between batches once `signal` is aborted.
+     */
+    private async prefetchSignedUrls(filePaths: string[], signal?: AbortSignal): Promise<void> {
+        for (let i = 0; i < filePaths.length; i += this.SIGNED_URL_BATCH_SIZE) {
+            if (signal?.aborted) {
+                return;
+            }
 
-        // Store in both caches
-        const cacheEntry = {blobUrl, expiresAt};
-        this.blobCache.set(fileName, cacheEntry);
+            const batch = filePaths.slice(i, i + this.SIGNED_URL_BATCH_SIZE);
+            const expiresAt = Date.now() + this.SIGNED_URL_EXPIRY_SECONDS * 1000 - this.SIGNED_URL_REFRESH_MARGIN_MS;
 
-        try {
-            await indexedDBCache.set(fileName, blobUrl, blob, expiresAt);
-            console.log(`[MediaManager] Cached ${fileName} in memory + IndexedDB`);
-        } catch (idbError) {
-            console.warn(`[MediaManager] Failed to store in IndexedDB for ${fileName}:`, idbError);
-            // Continue anyway - in-memory cache still works
-        }
+            try {
+                const {data, error} = await this.getBucket().createSignedUrls(batch, this.SIGNED_URL_EXPIRY_SECONDS);
 
-        return blobUrl;
+                if (error) {
+                    console.warn('[MediaManager] Batch signed URL request failed:', error.message);
+                    continue;
+                }
+
+                data?.forEach(entry => {
+                    if (!entry.error && entry.path && entry.signedUrl) {
+                        this.signedUrlCache.set(entry.path, {signedUrl: entry.signedUrl, expiresAt});
+                    }
+                });
+            } catch (error) {
+                console.warn(
+                    '[MediaManager] Batch signed URL request failed:',
+                    error instanceof Error ? error.message : 'Unknown error'
+                );
+            }
+        }
     }
 
     /**
@@ -162,6 +384,23 @@ class MediaManager {
         return await this.getMediaUrl(resolvedPath);
     }
 
+    /**
+     * Returns the blob URL for a file if it is already in the in-memory cache,
+     * without touching IndexedDB or the network. Returns null on a miss.
+     */
+    public getCachedMediaUrl(
+        fileName: string,
+        userType: UserType,
+        gameVersion?: GameVersion
+    ): string | null {
+        const resolvedPath = this.resolveMediaPath(fileName, userType, gameVersion);
+        const memCached = this.blobCache.get(resolvedPath);
+        if (memCached && memCached.expiresAt > Date.now()) {
+            return memCached.blobUrl;
+        }
+        return null;
+    }
+
     /**
      * Resolves the actual media path based on version hierarchy logic
      */
@@ -282,7 +521,7 @@ class MediaManager {
         gameVersion: GameVersion,
         userType: UserType,
         onProgress: (progress: BulkDownloadProgress) => void,
-        concurrent: number = 5
+        concurrent: number = this.DEFAULT_BULK_DOWNLOAD_CONCURRENCY
     ): Promise<void> {
         // Prevent concurrent downloads
         if (this.isBulkDownloading) {
@@ -328,20 +567,28 @@ class MediaManager {
 
             console.log(`[MediaManager] Bulk downloading ${filePaths.length} files`);
 
-            // Download in batches to avoid overwhelming the browser
-            const batches = this.chunkArray(missingPaths, concurrent);
-
-            for (const batch of batches) {
-                if (this.bulkDownloadAbortController.signal.aborted) {
-                    break;
-                }
+            // Sign the first batch up front so the workers can start, and sign the
+            // rest in the background while those first downloads run
+            const bulkSignal = this.bulkDownloadAbortController.signal;
+            await this.prefetchSignedUrls(missingPaths.slice(0, this.SIGNED_URL_BATCH_SIZE), bulkSignal);
+            const remainingSigning = this.prefetchSignedUrls(missingPaths.slice(this.SIGNED_URL_BATCH_SIZE), bulkSignal);
+
+            // Keep up to `concurrent` downloads in flight; each worker pulls the next
+            // path as soon as its current one finishes, so one slow video no longer
+            // stalls a whole batch
+            let nextIndex = 0;
+            const downloadWorker = async (): Promise<void> => {
+                while (nextIndex < missingPaths.length) {
+                    if (bulkSignal.aborted) {
+                        return;
+                    }
 
-                const promises = batch.map(async (filePath) => {
+                    const filePath = missingPaths[nextIndex++];
                     try {
                         this.bulkDownloadProgress!.currentFile = filePath;
                         onProgress?.(this.bulkDownloadProgress!);
 
-                        await this.getMediaUrl(filePath, this.bulkDownloadAbortController!.signal);
+                        await this.getMediaUrl(filePath, bulkSignal);
 
                         this.bulkDownloadProgress!.downloaded++;
                         onProgress?.(this.bulkDownloadProgress!);
@@ -360,10 +607,15 @@ class MediaManager {
                         this.bulkDownloadProgress!.downloaded++;
                         onProgress?.(this.bulkDownloadProgress!);
                     }
-                });
+                }
+            };
 
-                await Promise.all(promises);
-            }
+            const workerCount = Math.max(1, Math.min(concurrent, missingPaths.length));
+            await Promise.all(Array.from({length: workerCount}, downloadWorker));
+            await remainingSigning;
+
+            // Only report completion once everything has actually landed in IndexedDB
+            await Promise.all(this.pendingCacheWrites);
 
             
             if (this.bulkDownloadAbortController.signal.aborted) {
@@ -429,17 +681,6 @@ class MediaManager {
 
         return Array.from(mediaPaths);    }
 
-    /**
-     * Helper to chunk array into smaller arrays
-     */
-    private chunkArray<T>(array: T[], size: number): T[][] {
-        const chunks: T[][] = [];
-        for (let i = 0; i < array.length; i += size) {
-            chunks.push(array.slice(i, i + size));
-        }
-        return chunks;
-    }
-
     /**
      * Check if bulk download cache contains given slidepaths.
      */
@@ -496,7 +737,11 @@ class MediaManager {
      * Clears all caches (memory + IndexedDB)
      */
     public clearCache(): void {
+        // Detach loads that are still running so later callers start fresh ones
+        this.cacheGeneration++;
+        this.inFlightLoads.clear();
         this.blobCache.clear();
+        this.signedUrlCache.clear();
         this.precachingInProgress.clear();
         this.lastPrecacheSlideIndex = null;
 
@@ -21,9 +21,11 @@ const CRITICAL_OPERATIONS = [
     'user profile'
 ];
 
+// All critical phrases folded into one case-insensitive pattern, built once
+const CRITICAL_OPERATION_PATTERN = new RegExp(CRITICAL_OPERATIONS.join('|'), 'i');
+
 const isCriticalOperation = (context: string): boolean => {
-    const lowerContext = context.toLowerCase();
-    return CRITICAL_OPERATIONS.some(op => lowerContext.includes(op));
+    return CRITICAL_OPERATION_PATTERN.test(context);
 };
 
 // Enhanced error formatter with specific Supabase error handling
@@ -1,15 +1,15 @@
 // src/shared/utils/video/helpers.ts - Simplified basic utilities only
 
+const VIDEO_EXTENSIONS: ReadonlySet<string> = new Set(['mp4', 'webm', 'ogg', 'mov']);
+
 /**
  * Simple video detection based on filename path
  */
 export const isVideo = (path?: string): boolean => {
     if (!path) return false;
-    const lowerPath = path.toLowerCase();
-    return lowerPath.endsWith(".mp4") ||
-        lowerPath.endsWith(".webm") ||
-        lowerPath.endsWith(".ogg") ||
-        lowerPath.endsWith(".mov");
+    const dotIndex = path.lastIndexOf('.');
+    if (dotIndex === -1) return false;
+    return VIDEO_EXTENSIONS.has(path.slice(dotIndex + 1).toLowerCase());
 };
 
 /**
@@ -19,6 +19,16 @@ import { GameVersionManager } from '@core/game/GameVersionManager';
 import { CheckCircle2 } from 'lucide-react';
 import PrintHandoutsModal from '../components/Dashboard/PrintHandoutsModel';
 
+/**
+ * Returns a new array ordered newest first. Each created_at is parsed once up
+ * front rather than twice per comparison.
+ */
+const sortByNewest = <T extends { created_at: string }>(sessions: T[]): T[] =>
+    sessions
+        .map(session => ({session, time: new Date(session.created_at).getTime()}))
+        .sort((a, b) => b.time - a.time)
+        .map(({session}) => session);
+
 const DashboardPage: React.FC = () => {
     const {user, loading: authLoading} = useAuth();
     const location = useLocation();
@@ -80,12 +90,12 @@ const DashboardPage: React.FC = () => {
     }, [shouldAutoRefresh, authLoading, user, clearCache, refetchGames]);
 
     // Combine active and draft games
-    const activeGames = [
+    const activeGames = sortByNewest([
         ...games.draft.map(game => ({...game, displayStatus: 'draft' as const})),
         ...games.active.map(game => ({...game, displayStatus: 'active' as const}))
-    ].sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
+    ]);
 
-    const completedGames = games.completed.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
+    const completedGames = sortByNewest(games.completed);
 
     const getStatusConfig = (status: 'draft' | 'active' | 'completed') => {
         switch (status) {
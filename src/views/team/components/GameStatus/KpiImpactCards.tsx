@@ -25,6 +25,9 @@ interface ImpactCard {
     source: string;
 }
 
+// Leading challenge ID in an adjustment description, e.g. "CH1_..."
+const CHALLENGE_ID_PATTERN = /^([A-Z0-9_]+)/;
+
 const KpiImpactCards: React.FC<KpiImpactCardsProps> = ({
                                                            teamId,
                                                            currentRound,
@@ -96,7 +99,7 @@ const KpiImpactCards: React.FC<KpiImpactCardsProps> = ({
     // ========================================================================
     const extractChallengeFromDescription = (description: string): string => {
         // Try to extract challenge ID from description
-        const match = description.match(/^([A-Z0-9_]+)/);
+        const match = description.match(CHALLENGE_ID_PATTERN);
         return match ? match[1].toLowerCase() : 'unknown';
     };
 
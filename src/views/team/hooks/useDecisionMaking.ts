@@ -8,6 +8,9 @@ import {MultiSelectChallengeTracker} from "@core/game/MultiSelectChallengeTracke
 import {ForcedSelectionTracker} from "@core/game/ForcedSelectionTracker.ts";
 import {formatCurrency} from '@shared/utils/formatUtils';
 
+// Matches the option letter prefix of an investment name, e.g. "A. Strategic Plan"
+const INVESTMENT_LETTER_PATTERN = /^([A-Z])\./;
+
 export interface DecisionState {
     selectedInvestmentOptions: string[];  // CHANGED: now stores ['A', 'B', 'C']
     spentBudget: number;
@@ -402,7 +405,7 @@ export const useDecisionMaking = ({
         if (investmentId && investmentOptions.length > 0) {
             const investment = investmentOptions.find(inv => inv.id === investmentId);
             if (investment) {
-                const letter = investment.name.match(/^([A-Z])\./)?.[1];
+                const letter = investment.name.match(INVESTMENT_LETTER_PATTERN)?.[1];
                 letterToStore = letter || investmentId;
             }
         }
@@ -420,7 +423,7 @@ export const useDecisionMaking = ({
         if (investmentId && investmentOptions.length > 0) {
             const investment = investmentOptions.find(inv => inv.id === investmentId);
             if (investment) {
-                const letter = investment.name.match(/^([A-Z])\./)?.[1];
+                const letter = investment.name.match(INVESTMENT_LETTER_PATTERN)?.[1];
                 letterToStore = letter || investmentId;
             }
         }
@@ -97,13 +97,18 @@ export const useTeamGameState = ({
 
                 // CRITICAL FIX: If this is a KPI reset slide and no data exists yet, wait for it
                 if (!newRoundData && (currentActiveSlide.type === 'kpi_reset' || isSlideAfterKpiReset(currentActiveSlide))) {
-                    // Retry logic: Wait up to 3 seconds for KPI reset processing to complete
-                    let attempts: number = 0;
-                    const maxAttempts = 6; // 6 attempts * 500ms = 3 seconds
-
-                    while (attempts < maxAttempts && !newRoundData) {
-                        await new Promise(resolve => setTimeout(resolve, 500));
-                        attempts++;
+                    // Retry logic: Wait up to 3 seconds for KPI reset processing to complete.
+                    // Poll quickly at first (the host usually finishes within a few hundred ms)
+                    // and back off so slow resets don't cost extra queries.
+                    const maxWaitMs = 3000;
+                    let waitedMs = 0;
+                    let pollDelayMs = 100;
+
+                    while (waitedMs < maxWaitMs && !newRoundData) {
+                        const delay = Math.min(pollDelayMs, maxWaitMs - waitedMs);
+                        await new Promise(resolve => setTimeout(resolve, delay));
+                        waitedMs += delay;
+                        pollDelayMs *= 2;
 
                         newRoundData = await db.kpis.getForTeamRound(sessionId, loggedInTeamId, targetRound);
                         if (newRoundData) {
@@ -112,7 +117,7 @@ export const useTeamGameState = ({
                     }
 
                     if (!newRoundData) {
-                        console.warn(`[useTeamGameState] ⚠️ Round ${targetRound} data still missing after ${maxAttempts * 500}ms, falling back to R${targetRound - 1}`);
+                        console.warn(`[useTeamGameState] ⚠️ Round ${targetRound} data still missing after ${maxWaitMs}ms, falling back to R${targetRound - 1}`);
                         targetRound = (targetRound - 1) as 1 | 2 | 3;
                     }
                 }